@@ -19,6 +19,24 @@ from pymunk import Vec2d
 import pymunk.pygame_util
 
 
+def _compute_paddle_velocity(mouse_x, mouse_y, paddle_x, paddle_y,
+                             min_x, max_x, min_y, max_y, screen_y, max_velocity):
+    """
+    Velocity that moves a paddle towards the mouse, limited to its bounds and max_velocity
+    :return: (float, float)
+    """
+    target_x = max(min_x, min(max_x, mouse_x))
+    target_y = screen_y-max(min_y, min(max_y, mouse_y))
+    velocity_x = target_x-paddle_x
+    velocity_y = target_y-paddle_y
+    magnitude = math.hypot(velocity_x, velocity_y)
+    if magnitude > 20:
+        scale = max_velocity/magnitude
+    else:
+        scale = max_velocity/20
+    return velocity_x*scale, velocity_y*scale
+
+
 class Hockey(object):
     def __init__(self):
         # Powerups:
@@ -30,6 +48,8 @@ class Hockey(object):
             'speed': 2,
             'friction': 3
         }
+        # Indexed by powerup type
+        self._powerup_setters = (None, self._enable_gravity, self._enable_speed, self._enable_friction)
 
         # Options:
         # Hit cooldown
@@ -44,6 +64,7 @@ class Hockey(object):
         self.powerup_radius = 20
         # FPS
         self.fps = 100
+        self._default_fps = self.fps
         # Speed
         self.max_velocity = 1700
         self.controlled_velocity = 750
@@ -52,35 +73,58 @@ class Hockey(object):
         self._time_to_next_hit = self.cooldown_length
         self._time_to_cooldown = self.hit_length
 
-        # Sprites
-        self._puck_img = pygame.image.load("puck.png")
-        self._paddle_img = pygame.image.load("paddle.png")
-
         # Screen size calculations
         self._rink_x = self.screen_x-300
         self._rink_y = self._rink_x/2
         self._padding_y = (self.screen_y-self._rink_y)/2
+        # Paddle bounds
+        edge = self.puck_radius-5
+        self._p1_min_x = self._rink_x*0.05+150+edge
+        self._p1_max_x = self.screen_x/2-edge
+        self._p1_min_y = self._padding_y+edge
+        self._p1_max_y = self._padding_y+self._rink_y-edge
+        self._p2_min_x = self.screen_x/2+edge
+        self._p2_max_x = self._rink_x*0.95+150-edge
+        self._p2_min_y = self._padding_y+edge
+        self._p2_max_y = self._padding_y+self._rink_y-edge
+        # Pucks past this x (or below 185) are in a goal
+        self._rink_goal_max_x = self._rink_x+115
 
         # Space
         self._space = pymunk.Space()
         self._space.damping = 0.8
+        self._default_damping = self._space.damping
 
         # Physics
         # Time step
         self._dt = 1.0 / 60.0
-        # Number of physics steps per screen frame
-        self._physics_steps_per_frame = 1
+        # Most physics steps to catch up on in one screen frame
+        self._max_physics_steps_per_frame = 5
+        # Real time, in seconds, not yet simulated
+        self._accumulator = 0.0
 
         # pygame
         self._screen = pygame.display.set_mode((self.screen_x, self.screen_y), pygame.FULLSCREEN)
         # self._screen = pygame.display.set_mode((self.screen_x, self.screen_y))
         self._clock = pygame.time.Clock()
+        # Only queue the events _process_events handles
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([QUIT, KEYDOWN, VIDEOEXPOSE, ACTIVEEVENT])
 
-        self._draw_options = pymunk.pygame_util.DrawOptions(self._screen)
+        # Sprites
+        self._puck_img, self._puck_offset = self._load_sprite("puck.png")
+        self._paddle_img, self._paddle_offset = self._load_sprite("paddle.png")
 
         # Static walls that line the rink
         self._add_static_scenery()
 
+        # Bake the static rink into a background so it isn't redrawn every frame
+        self._background = pygame.Surface((self.screen_x, self.screen_y)).convert()
+        self._background.fill(THECOLORS["white"])
+        self._space.debug_draw(pymunk.pygame_util.DrawOptions(self._background))
+        # Screen areas drawn last frame; the first frame presents the whole screen
+        self._dirty_rects = [self._screen.get_rect()]
+
         # Collision Handler
         self.colltype_puck = 1
         self.colltype_powerup = 2
@@ -90,8 +134,11 @@ class Hockey(object):
         # Create the game objects
         self._paddle_1 = self._create_paddle(self._rink_x/8+150, self.screen_y/2)
         self._paddle_2 = self._create_paddle(self.screen_x-(self._rink_x/8+150), self.screen_y/2)
-        self._pucks = []
-        self._powerups = {}
+        # Keyed by id(shape) so a scored puck can be removed in O(1)
+        self._pucks = {}
+        # Puck targeted by Player 2's Q hit
+        self._primary_puck = None
+        self._powerups = []
 
         # Execution control
         self._running = True
@@ -110,53 +157,80 @@ class Hockey(object):
 
         self._update_score()
 
+        self._big_text_str = None
         self._big_text('')
 
+        self._cooldown_topright = (self.screen_x-5, 5)
+        self._cooldown_value = 0
         self._cooldown_text = self._small_font.render('0', True, (0, 0, 0))
-        self._cooldown_textRect = self._cooldown_text.get_rect()
-        self._cooldown_textRect.top = 5
-        self._cooldown_textRect.right = self.screen_x-5
+        self._cooldown_textRect = self._cooldown_text.get_rect(topright=self._cooldown_topright)
 
         # Start time
-        self._last = pygame.time.get_ticks()
-        self._last_powerup = pygame.time.get_ticks()
-        self._last_powerup_created = pygame.time.get_ticks()
+        now = pygame.time.get_ticks()
+        self._last = now
+        self._last_powerup = now
+        self._last_powerup_created = now
+        self._last_caption = now
 
     def powerup(self, arbiter, space, data):
-        if self._powerups[arbiter.shapes[0]] == self._powerup_types['gravity']:
-            self._gravity = True
-        if self._powerups[arbiter.shapes[0]] == self._powerup_types['speed']:
-            self._speed = True
-        if self._powerups[arbiter.shapes[0]] == self._powerup_types['friction']:
-            self._friction = True
+        shape = arbiter.shapes[0]
+        self._powerup_setters[shape.powerup_type]()
 
         self._last_powerup = pygame.time.get_ticks()
-        space.remove(arbiter.shapes[0], arbiter.shapes[0].body)
-        del self._powerups[arbiter.shapes[0]]
+        space.remove(shape, shape.body)
+        self._powerups.remove(shape)
         return True
 
-    def _check_powerups(self):
-        if self._gravity and pygame.time.get_ticks() - self._last_powerup <= 10000:
-            # Enable powerup
-            self._space.gravity = (0, -400)
-        else:
-            # Disable powerup
-            self._space.gravity = (0, 0)
-            self._gravity = False
-        if self._speed and pygame.time.get_ticks() - self._last_powerup <= 10000:
-            # Enable powerup
-            self.fps = 120
-        else:
-            # Disable powerup
-            self.fps = 60
-            self._speed = False
-        if self._friction and pygame.time.get_ticks() - self._last_powerup <= 10000:
-            # Enable powerup
-            self._space.damping = 0.2
-        else:
-            # Disable powerup
-            self._space.damping = 0.7
-            self._speed = False
+    def _enable_gravity(self):
+        """
+        Turn on the gravity powerup.
+        :return: None
+        """
+        self._gravity = True
+
+    def _enable_speed(self):
+        """
+        Turn on the speed powerup.
+        :return: None
+        """
+        self._speed = True
+
+    def _enable_friction(self):
+        """
+        Turn on the friction powerup.
+        :return: None
+        """
+        self._friction = True
+
+    def _check_powerups(self, now):
+        # Nothing to update unless a powerup is active
+        if not (self._gravity or self._speed or self._friction):
+            return
+        enabled = now - self._last_powerup <= 10000
+        if self._gravity:
+            if enabled:
+                # Enable powerup
+                self._space.gravity = (0, -400)
+            else:
+                # Disable powerup
+                self._space.gravity = (0, 0)
+                self._gravity = False
+        if self._speed:
+            if enabled:
+                # Enable powerup
+                self.fps = 120
+            else:
+                # Disable powerup
+                self.fps = self._default_fps
+                self._speed = False
+        if self._friction:
+            if enabled:
+                # Enable powerup
+                self._space.damping = 0.2
+            else:
+                # Disable powerup
+                self._space.damping = self._default_damping
+                self._friction = False
 
     def run(self):
         """
@@ -165,18 +239,38 @@ class Hockey(object):
         """
         # Main loop
         while self._running:
-            # Progress time forward
-            for x in range(self._physics_steps_per_frame):
+            # Query SDL once per frame
+            mouse_x, mouse_y = pygame.mouse.get_pos()
+
+            # Progress time forward one step per frame period. Clock.tick waits whole milliseconds,
+            # so use the same truncated period to get exactly one step on an on-time frame.
+            step_time = int(1000 / self.fps) / 1000.0
+            steps = 0
+            while self._accumulator >= step_time:
+                if steps == self._max_physics_steps_per_frame:
+                    # Too far behind; drop the backlog rather than fall further behind
+                    self._accumulator = 0.0
+                    break
+                # Player 1's velocity depends on the paddle's position, so update it every step
+                self._set_paddle_1_velocity(mouse_x, mouse_y)
                 self._space.step(self._dt)
+                self._accumulator -= step_time
+                steps += 1
 
-            self._process_events()
-            self._check_goals()
+            now = pygame.time.get_ticks()
+            self._process_events(now)
+            self._check_goals(now)
             self._clear_screen()
-            self._draw_objects()
-            pygame.display.flip()
+            dirty_rects = self._draw_objects()
+            # Present only what was drawn this frame and last frame
+            pygame.display.update(self._dirty_rects + dirty_rects)
+            self._dirty_rects = dirty_rects
             # Delay fixed time between frames
-            self._clock.tick(self.fps)
-            pygame.display.set_caption("fps: " + str(self._clock.get_fps()))
+            self._accumulator += self._clock.tick(self.fps) / 1000.0
+            # Setting the window title can be slow, so only do it once a second
+            if now - self._last_caption >= 1000:
+                pygame.display.set_caption(f"fps: {self._clock.get_fps():.0f}")
+                self._last_caption = now
 
     def flip_y(self, y):
         """
@@ -202,34 +296,39 @@ class Hockey(object):
             self._padding_y + self._rink_y * 0.3,
             self.screen_x / 2
         ]
-        static_lines = [
-            pymunk.Segment(static_body, (points[0], points[4]), (points[1], points[4]), 0.0),
-            pymunk.Segment(static_body, (points[1], points[4]), (points[1], points[7]), 0.0),
-            pymunk.Segment(static_body, (points[1], points[5]), (points[1], points[6]), 0.0),
-            pymunk.Segment(static_body, (points[1], points[6]), (points[0], points[6]), 0.0),
-            pymunk.Segment(static_body, (points[0], points[4]), (points[0], points[7]), 0.0),
-            pymunk.Segment(static_body, (points[0], points[5]), (points[0], points[6]), 0.0),
-            pymunk.Segment(static_body, (points[2], points[7]), (points[0], points[7]), 0.0),
-            pymunk.Segment(static_body, (points[2], points[5]), (points[0], points[5]), 0.0),
-            pymunk.Segment(static_body, (points[3], points[7]), (points[1], points[7]), 0.0),
-            pymunk.Segment(static_body, (points[3], points[5]), (points[1], points[5]), 0.0),
-            pymunk.Segment(static_body, (points[2], points[7]), (points[2], points[5]), 0.0),
-            pymunk.Segment(static_body, (points[3], points[7]), (points[3], points[5]), 0.0),
+        # Segment endpoints as indices into points: ((x1, y1), (x2, y2))
+        wall_endpoints = [
+            ((0, 4), (1, 4)),
+            ((1, 4), (1, 7)),
+            ((1, 5), (1, 6)),
+            ((1, 6), (0, 6)),
+            ((0, 4), (0, 7)),
+            ((0, 5), (0, 6)),
+            ((2, 7), (0, 7)),
+            ((2, 5), (0, 5)),
+            ((3, 7), (1, 7)),
+            ((3, 5), (1, 5)),
+            ((2, 7), (2, 5)),
+            ((3, 7), (3, 5)),
         ]
-        sensor_lines = [
-            pymunk.Segment(static_body, (points[0], points[7]), (points[0], points[5]), 0.0),
-            pymunk.Segment(static_body, (points[1], points[7]), (points[1], points[5]), 0.0),
-            pymunk.Segment(static_body, (points[8], points[4]), (points[8], points[6]), 0.0)
+        sensor_endpoints = [
+            ((0, 7), (0, 5)),
+            ((1, 7), (1, 5)),
+            ((8, 4), (8, 6)),
         ]
-        for line in static_lines:
+        lines = []
+        for (x1, y1), (x2, y2) in wall_endpoints:
+            line = pymunk.Segment(static_body, (points[x1], points[y1]), (points[x2], points[y2]), 0.0)
             line.elasticity = 0.8
             line.friction = 0.2
-        for line in sensor_lines:
+            lines.append(line)
+        for (x1, y1), (x2, y2) in sensor_endpoints:
+            line = pymunk.Segment(static_body, (points[x1], points[y1]), (points[x2], points[y2]), 0.0)
             line.sensor = True
-        self._space.add(static_lines)
-        self._space.add(sensor_lines)
+            lines.append(line)
+        self._space.add(lines)
 
-    def _process_events(self):
+    def _process_events(self, now):
         """
         Handle game and events like keyboard input. Call once per frame only.
         :return: None
@@ -242,68 +341,58 @@ class Hockey(object):
                 self._running = False
             elif event.type == KEYDOWN and event.key == K_p:
                 pygame.image.save(self._screen, "hockey.png")
+            elif event.type == VIDEOEXPOSE or event.type == ACTIVEEVENT:
+                # The window was exposed or regained focus; present the whole screen again
+                self._dirty_rects = [self._screen.get_rect()]
 
         # Handle powerups
-        if pygame.time.get_ticks() - self._last_powerup_created >= 10000:
-            if random.randint(1,1000) == 1:
+        if now - self._last_powerup_created >= 10000:
+            if random.random() < 0.001:
                 x = random.randint(150, 150+self._rink_x)
                 y = random.randint(self._padding_y, self._padding_y+self._rink_y)
         #        self._create_powerup(x, y, self.powerup_radius, random.randint(1, len(self._powerup_types)))
-        # self._check_powerups()
-
-        # Set velocity of Player 1
-        mouse_y = pygame.mouse.get_pos()[1]
-        max_y = self._padding_y+self._rink_y-(self.puck_radius-5)
-        min_y = self._padding_y+(self.puck_radius-5)
-        limited_mouse_y = max(min(max_y, mouse_y), min_y)
-        limited_mouse_y = self.flip_y(limited_mouse_y)
-        mouse_x = pygame.mouse.get_pos()[0]
-        max_x = self.screen_x/2-(self.puck_radius-5)
-        min_x = self._rink_x*0.05+150+(self.puck_radius-5)
-        limited_mouse_x = max(min_x, min(max_x, mouse_x))
-        velocity_x = limited_mouse_x-self._paddle_1.body.position[0]
-        velocity_y = limited_mouse_y-self._paddle_1.body.position[1]
-        scaled_velocity_x = velocity_x*(self.max_velocity/20)
-        scaled_velocity_y = velocity_y*(self.max_velocity/20)
-        magnitude = math.sqrt(round(velocity_x)**2+round(velocity_y)**2)
-        if magnitude > 20:
-            scaled_velocity_x = (velocity_x/magnitude)*1700
-            scaled_velocity_y = (velocity_y/magnitude)*1700
-        self._paddle_1.body.velocity = (scaled_velocity_x, scaled_velocity_y)
+        # self._check_powerups(now)
 
         # Set velocity of Player 2 by WASD keys
         velocity_x = 0
         velocity_y = 0
         key = pygame.key.get_pressed()
-        if key[K_w] and self._paddle_2.body.position[1] <= self._padding_y+self._rink_y-(self.puck_radius-5):
+        paddle_x, paddle_y = self._paddle_2.body.position
+        if key[K_w] and paddle_y <= self._p2_max_y:
             velocity_y = self.controlled_velocity
-        if key[K_a] and self._paddle_2.body.position[0] >= self.screen_x/2+(self.puck_radius-5):
+        if key[K_a] and paddle_x >= self._p2_min_x:
             velocity_x = -self.controlled_velocity
-        if key[K_s] and self._paddle_2.body.position[1] >= self._padding_y+(self.puck_radius-5):
+        if key[K_s] and paddle_y >= self._p2_min_y:
             velocity_y = -self.controlled_velocity
-        if key[K_d] and self._paddle_2.body.position[0] <= self._rink_x*0.95+150-(self.puck_radius-5):
+        if key[K_d] and paddle_x <= self._p2_max_x:
             velocity_x = self.controlled_velocity
 
         # Update cooldown text
         if self._time_to_next_hit <= 0:
             self._time_to_next_hit = 0
-        self._cooldown_text = self._small_font.render(str(round(self._time_to_next_hit/6)), True, (0, 0, 0))
-        self._cooldown_textRect = self._cooldown_text.get_rect()
-        self._cooldown_textRect.top = 5
-        self._cooldown_textRect.right = self.screen_x-5
+        # The displayed value only changes every 6 frames
+        cooldown_value = round(self._time_to_next_hit/6)
+        if cooldown_value != self._cooldown_value:
+            self._cooldown_value = cooldown_value
+            self._cooldown_text = self._small_font.render(str(cooldown_value), True, (0, 0, 0))
+            self._cooldown_textRect = self._cooldown_text.get_rect(topright=self._cooldown_topright)
 
         # Set velocity of Player 2 by Q key
-        if key[K_q] and self._time_to_next_hit <= 0 <= self._time_to_cooldown and self._goal is False:
+        puck = self._primary_puck
+        hit_ready = self._time_to_next_hit <= 0 <= self._time_to_cooldown
+        if key[K_q] and hit_ready and self._goal is False and puck is not None:
             self._time_to_cooldown -= 1
-            velocity_x = (self._pucks[0].body.position[0]-self._paddle_2.body.position[0])
-            velocity_y = (self._pucks[0].body.position[1]-self._paddle_2.body.position[1])
+            puck_x, puck_y = puck.body.position
+            velocity_x = puck_x-paddle_x
+            velocity_y = puck_y-paddle_y
             scaled_velocity_x = 0
             scaled_velocity_y = 0
-            magnitude = math.sqrt(round(velocity_x)**2+round(velocity_y)**2)
+            magnitude = math.hypot(velocity_x, velocity_y)
             if magnitude > 20:
-                scaled_velocity_x = (velocity_x/magnitude)*self.max_velocity
-                scaled_velocity_y = (velocity_y/magnitude)*self.max_velocity
-            if self._paddle_2.body.position[0] <= self.screen_x/2+(self.puck_radius-5) and scaled_velocity_x < 0:
+                scale = self.max_velocity/magnitude
+                scaled_velocity_x = velocity_x*scale
+                scaled_velocity_y = velocity_y*scale
+            if paddle_x <= self._p2_min_x and scaled_velocity_x < 0:
                 scaled_velocity_x = 0
             self._paddle_2.body.velocity = (scaled_velocity_x, scaled_velocity_y)
             self._cooldown = True
@@ -315,57 +404,74 @@ class Hockey(object):
             self._time_to_next_hit -= 1
             self._time_to_cooldown = self.hit_length
 
-    def _check_goals(self):
+    def _set_paddle_1_velocity(self, mouse_x, mouse_y):
+        """
+        Set the velocity of Player 1 towards the mouse. Call before every physics step.
+        :return: None
+        """
+        paddle_x, paddle_y = self._paddle_1.body.position
+        self._paddle_1.body.velocity = _compute_paddle_velocity(
+            mouse_x, mouse_y, paddle_x, paddle_y,
+            self._p1_min_x, self._p1_max_x, self._p1_min_y, self._p1_max_y,
+            self.screen_y, self.max_velocity
+        )
+
+    def _check_goals(self, now):
         """
         Check for goals. Call once per frame only.
         :return: None
         """
-        pucks_to_remove = []
-        for puck in self._pucks:
-            if puck.body.position.x < 185 or puck.body.position.x > self._rink_x + 115:
-                pucks_to_remove.append(puck)
-        for puck in pucks_to_remove:
-            self._space.remove(puck, puck.body)
-            self._pucks.remove(puck)
-            if puck.body.position.x < 185:
-                self._score_2 += 1
-                self._goal_player = 2
-            else:
-                self._score_1 += 1
-                self._goal_player = 1
-            self._goal = True
-            self._update_score()
-            self._last = pygame.time.get_ticks()
-            self._big_text('Goal!')
-
-        # Handle wins
-        if self._score_1 >= 7:
-            self._win_1 = True
-            self._win_2 = False
-        elif self._score_2 >= 7:
-            self._win_2 = True
-            self._win_1 = False
-        else:
-            self._win_2 = False
-            self._win_1 = False
-        if self._win_1 or self._win_2:
-            if self._goal and pygame.time.get_ticks() - self._last >= 1000:
-                if self._win_1:
+        # Read each puck's x once, then only touch pymunk again for pucks past a goal line
+        if self._pucks:
+            max_x = self._rink_goal_max_x
+            for key, puck in list(self._pucks.items()):
+                x = puck.body.position.x
+                if not (x < 185 or x > max_x):
+                    continue
+                self._space.remove(puck, puck.body)
+                del self._pucks[key]
+                if puck is self._primary_puck:
+                    self._primary_puck = next(iter(self._pucks.values()), None)
+                if x < 185:
+                    self._score_2 += 1
+                    self._goal_player = 2
+                else:
+                    self._score_1 += 1
+                    self._goal_player = 1
+                self._goal = True
+                self._update_score()
+                self._last = now
+                self._big_text('Goal!')
+
+        # Handle wins, a second after a goal
+        if self._goal and now - self._last >= 1000:
+            if self._score_1 >= 7 or self._score_2 >= 7:
+                if self._score_1 >= 7:
                     text = 'Player 1 Wins!'
                 else:
                     text = 'Player 2 Wins!'
                 self._big_text(text)
-                if pygame.time.get_ticks() - self._last >= 2000:
+                if now - self._last >= 2000:
                     self._goal_player = 2
                     self._reset()
                     self._score_1 = 0
                     self._score_2 = 0
                     self._update_score()
-        else:
-            if self._goal and pygame.time.get_ticks() - self._last >= 1000:
+            else:
                 self._reset()
         if self._countdown:
-            self._start()
+            self._start(now)
+
+    def _load_sprite(self, path):
+        """
+        Load an image converted to the display format and cropped to its visible pixels.
+        :return: (pygame.Surface, Vec2d offset from the image's center to its top left)
+        """
+        img = pygame.image.load(path).convert_alpha()
+        # The images are mostly transparent; cropping keeps blits and dirty rects small
+        rect = img.get_bounding_rect()
+        offset = Vec2d(*img.get_size()) / 2. - Vec2d(rect.x, rect.y)
+        return img.subsurface(rect).copy(), offset
 
     def _create_puck(self, x):
         """
@@ -381,7 +487,9 @@ class Hockey(object):
         shape.friction = 0.2
         shape.collision_type = self.colltype_puck
         self._space.add(body, shape)
-        self._pucks.append(shape)
+        self._pucks[id(shape)] = shape
+        if self._primary_puck is None:
+            self._primary_puck = shape
 
     def _create_powerup(self, x, y, radius, type):
         """
@@ -395,8 +503,9 @@ class Hockey(object):
         body.position = x, y
         shape = pymunk.Circle(body, radius, (0, 0))
         shape.collision_type = self.colltype_powerup
+        shape.powerup_type = type
         self._space.add(body, shape)
-        self._powerups.update({shape: type})
+        self._powerups.append(shape)
 
     def _create_paddle(self, x, y):
         """
@@ -415,43 +524,52 @@ class Hockey(object):
 
     def _clear_screen(self):
         """
-        Clears the screen.
+        Clears the screen to the static rink background.
         :return: None
         """
-        self._screen.fill(THECOLORS["white"])
+        self._screen.blit(self._background, (0, 0))
 
     def _draw_objects(self):
         """
         Draw the objects.
-        :return: None
+        :return: list of pygame.Rect areas that were drawn to
         """
-        self._space.debug_draw(self._draw_options)
+        screen_y = self.screen_y
+        dirty_rects = []
+
+        # Draw powerups
+        for powerup in self._powerups:
+            p = powerup.body.position
+            p = (int(p.x), int(-p.y+screen_y))
+            rect = pygame.draw.circle(self._screen, THECOLORS["red"], p, int(powerup.radius))
+            dirty_rects.append(rect)
 
         # Draw text
-        self._screen.blit(self._score_text, self._score_textRect)
-        self._screen.blit(self._goal_text, self._goal_textRect)
-        self._screen.blit(self._cooldown_text, self._cooldown_textRect)
+        dirty_rects.append(self._screen.blit(self._score_text, self._score_textRect))
+        dirty_rects.append(self._screen.blit(self._goal_text, self._goal_textRect))
+        dirty_rects.append(self._screen.blit(self._cooldown_text, self._cooldown_textRect))
 
         # Draw puck image
-        for puck in self._pucks:
+        offset = self._puck_offset
+        for puck in self._pucks.values():
             p = puck.body.position
-            p = Vec2d(p.x, -p.y+self.screen_y)
-            offset = Vec2d(self._puck_img.get_size()) / 2.
+            p = Vec2d(p.x, -p.y+screen_y)
             p = p - offset
-            self._screen.blit(self._puck_img, p)
+            dirty_rects.append(self._screen.blit(self._puck_img, p))
 
         # Draw paddle image
+        offset = self._paddle_offset
         p = self._paddle_1.body.position
-        p = Vec2d(p.x, -p.y+self.screen_y)
-        offset = Vec2d(self._paddle_img.get_size()) / 2.
+        p = Vec2d(p.x, -p.y+screen_y)
         p = p - offset
-        self._screen.blit(self._paddle_img, p)
+        dirty_rects.append(self._screen.blit(self._paddle_img, p))
 
         p = self._paddle_2.body.position
-        p = Vec2d(p.x, -p.y+self.screen_y)
-        offset = Vec2d(self._paddle_img.get_size()) / 2.
+        p = Vec2d(p.x, -p.y+screen_y)
         p = p - offset
-        self._screen.blit(self._paddle_img, p)
+        dirty_rects.append(self._screen.blit(self._paddle_img, p))
+
+        return dirty_rects
 
     def _reset(self):
         """
@@ -466,12 +584,11 @@ class Hockey(object):
             y = self._rink_x*0.75+150
         self._create_puck(y)
 
-    def _start(self):
+    def _start(self, now):
         """
         Start the game with a countdown.
         :return: None
         """
-        now = pygame.time.get_ticks()
         if now-self._last >= 4500:
             self._countdown = False
             self._big_text('')
@@ -493,6 +610,10 @@ class Hockey(object):
         Draw large, centered text on the screen.
         :return: None
         """
+        # Only re-render when the text changes
+        if text == self._big_text_str:
+            return
+        self._big_text_str = text
         self._goal_text = self._big_font.render(text, True, (0, 0, 0))
         self._goal_textRect = self._goal_text.get_rect()
         self._goal_textRect.center = (self.screen_x/2, self.screen_y/2)